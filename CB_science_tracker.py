@@ -1,20 +1,169 @@
 #!/usr/bin/env python3
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import feedparser
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import os
+import shutil
+import hashlib
+import pickle
+import time
+import functools
 import pandas as pd
 from datetime import datetime, timedelta
 from pathlib import Path
 import urllib.parse
-import xml.etree.ElementTree as ET
-from bs4 import BeautifulSoup
+from lxml import etree as ET
 import re
+import html
 from rich.console import Console
 
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+def _escape(value):
+    # Feed and API fields can be missing or None; render those as empty instead of failing the report
+    return html.escape('' if value is None else str(value))
+
+def _truncate(text, limit=300):
+    if len(text) > limit:
+        return text[:limit - 3] + '...'
+    return text
+
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+
+def _dedupe(items):
+    # The same story often arrives from several feeds, so keep the first copy of each. Items are
+    # keyed on their DOI/URL/link; the normalized title is only a fallback for items without
+    # one, and placeholder titles never count as a match.
+    seen = set()
+    unique = []
+    for item in items:
+        key = item.get('url') or item.get('link')
+        if not key:
+            title = item.get('title') or ''
+            if title != "No title available":
+                key = _NON_ALNUM_RE.sub(' ', title.lower()).strip()
+        if key:
+            if key in seen:
+                continue
+            seen.add(key)
+        unique.append(item)
+    return unique
+
+@functools.lru_cache(maxsize=512)
+def _parse_iso_date(date_str):
+    # Papers in one report share a handful of dates, so parse each string once
+    return datetime.strptime(date_str, '%Y-%m-%d')
+
+@functools.lru_cache(maxsize=32)
+def _any_keyword_pattern(keywords):
+    # keywords is a tuple so the compiled pattern can be reused across calls
+    return re.compile('|'.join(re.escape(keyword.lower()) for keyword in keywords))
+
+# Spaces calls at least 1/per_second apart across all threads sharing the limiter
+class RateLimiter:
+    def __init__(self, per_second):
+        self.interval = 1.0 / per_second
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        with self._lock:
+            slot = max(self._next_slot, time.monotonic())
+            self._next_slot = slot + self.interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+# Pickle-backed cache with a TTL, shared by all threads of a report run
+class ObjectFileCache:
+    def __init__(self, cache_dir, ttl=timedelta(hours=24)):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl.total_seconds()
+        self._memory = {}
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    def _path(self, key):
+        return self.cache_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.pkl"
+
+    def get(self, key):
+        with self._lock:
+            if key in self._memory:
+                return self._memory[key]
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except Exception:
+            return None
+        with self._lock:
+            self._memory[key] = value
+        return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._memory[key] = value
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception:
+            # Unpicklable values still live in memory for the rest of the run
+            tmp_path.unlink(missing_ok=True)
+
+    def get_or_set(self, key, factory):
+        # Only one thread runs factory for a given key; the others wait and read its result
+        value = self.get(key)
+        if value is not None:
+            return value
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            value = self.get(key)
+            if value is None:
+                value = factory()
+                self.set(key, value)
+        return value
+
 class DailyBiotechTrackerHTML:
+    # PubMed field lookups, compiled once and shared by every article
+    _XP_ARTICLE = ET.XPath('.//Article')
+    _XP_TITLE = ET.XPath('.//ArticleTitle')
+    _XP_JOURNAL = ET.XPath('.//Journal/Title')
+    _XP_ABSTRACT = ET.XPath('.//Abstract/AbstractText')
+    _XP_AUTHORS = ET.XPath('.//Author')
+    _XP_PUB_DATE = ET.XPath('.//PubDate')
+    _XP_IDS = ET.XPath('.//ArticleId')
+
     def __init__(self):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        # NCBI answers over-limit requests with 429; _ncbi_get retries those itself after waiting
+        # on the rate limiter, so this adapter must not retry them behind the limiter's back
+        self.session.mount('https://eutils.ncbi.nlm.nih.gov/', HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504],
+                              respect_retry_after_header=False)
+        ))
+        self.request_timeout = (5, 30)
         # RSS feeds for news sources
         self.news_sources = {
             "Biotech Industry": [
@@ -41,6 +190,17 @@ class DailyBiotechTrackerHTML:
             ]
         }
         self.ncbi_base = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/"
+        # Identify ourselves to NCBI; an API key raises the limit from 3 to 10 requests/second
+        self.ncbi_api_key = os.environ.get('NCBI_API_KEY')
+        self.ncbi_params = {'tool': 'science_news'}
+        if os.environ.get('NCBI_EMAIL'):
+            self.ncbi_params['email'] = os.environ['NCBI_EMAIL']
+        if self.ncbi_api_key:
+            self.ncbi_params['api_key'] = self.ncbi_api_key
+        # NCBI's limit is requests per second, not requests in flight, so it is enforced by
+        # spacing calls out in time; a cap on concurrent calls would not stop bursts of 429s
+        ncbi_requests_per_second = 10 if self.ncbi_api_key else 3
+        self._ncbi_rate_limiter = RateLimiter(ncbi_requests_per_second)
         self.today = datetime.now()
         self.date_str = self.today.strftime('%Y-%m-%d')
         # Keywords with weights for relevance scoring (as in your original script)
@@ -107,6 +267,17 @@ class DailyBiotechTrackerHTML:
                 "skin microbiome cosmetic": 8
             }
         }
+        # Search inputs depend only on the keywords, so build them once per process
+        self._pubmed_queries = {
+            category: ' OR '.join(f'"{keyword}"[All Fields]' for keyword in keywords)
+            for category, keywords in self.keywords.items()
+        }
+        self._biorxiv_kw_lists = {category: list(keywords) for category, keywords in self.keywords.items()}
+        # Lowercased once here so scoring doesn't redo it for every paper
+        self._keywords_lc = {
+            category: [(keyword.lower(), weight) for keyword, weight in keywords.items()]
+            for category, keywords in self.keywords.items()
+        }
         self.journal_scores = {
             'Nature': 10,
             'Science': 10,
@@ -131,55 +302,105 @@ class DailyBiotechTrackerHTML:
         }
         self.output_dir = Path('.')
         self.output_dir.mkdir(exist_ok=True)
+        self.cache = ObjectFileCache(self.output_dir / '.cache')
         self.console = Console()
 
     def get_news_from_rss(self, feed_url, days_back=2, max_items=5):
         try:
-            feed = feedparser.parse(feed_url)
+            feed = self._get_rss_raw(feed_url)
+            source = feed.feed.get('title', 'Unknown Source')
+            now = datetime.now()
+            # (now - pub_date).days <= days_back holds exactly when pub_date is after this cutoff
+            cutoff = (now - timedelta(days=days_back + 1)).timetuple()[:6]
             recent_entries = []
             for entry in feed.entries[:15]:
-                if hasattr(entry, 'published_parsed'):
-                    pub_date = datetime(*entry.published_parsed[:6])
-                elif hasattr(entry, 'updated_parsed'):
-                    pub_date = datetime(*entry.updated_parsed[:6])
+                parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+                if parsed:
+                    pub_time = tuple(parsed[:6])
+                    if pub_time <= cutoff:
+                        continue
+                    pub_date = datetime(*pub_time)
                 else:
-                    pub_date = datetime.now() - timedelta(days=1)
-                if (datetime.now() - pub_date).days <= days_back:
-                    recent_entries.append({
-                        'title': entry.title,
-                        'link': entry.link,
-                        'date': pub_date.strftime('%Y-%m-%d'),
-                        'summary': self.clean_html(entry.get('summary', '')),
-                        'source': feed.feed.get('title', 'Unknown Source')
-                    })
-            recent_entries.sort(key=lambda x: x['date'], reverse=True)
+                    pub_date = now - timedelta(days=1)
+                recent_entries.append({
+                    'title': entry.title,
+                    'link': entry.link,
+                    'date': pub_date.strftime('%Y-%m-%d'),
+                    'summary': self.clean_html(entry.get('summary', '')),
+                    'source': source,
+                    # Numeric sort key; 'date' is only for display
+                    '_ts': pub_date.timestamp()
+                })
+            recent_entries.sort(key=lambda x: x['_ts'], reverse=True)
             return recent_entries[:max_items]
         except Exception as e:
             print(f"Error fetching RSS feed {feed_url}: {e}")
             return []
 
+    def _get_rss_raw(self, feed_url):
+        feed = self.cache.get(f"rss:{feed_url}")
+        if feed is None:
+            feed = feedparser.parse(feed_url)
+            # Don't pin a failed or empty fetch for the whole TTL
+            if feed.entries:
+                self.cache.set(f"rss:{feed_url}", feed)
+        return feed
+
     def clean_html(self, text):
         if not text:
             return ""
-        soup = BeautifulSoup(text, 'html.parser')
-        text = soup.get_text()
-        text = re.sub(r'\s+', ' ', text).strip()
-        if len(text) > 300:
-            text = text[:297] + '...'
-        return text
+        # Plain-text summaries (most of them) need neither tag stripping nor unescaping
+        if '<' in text:
+            text = _TAG_RE.sub(' ', text)
+        if '&' in text:
+            text = html.unescape(text)
+        text = _WS_RE.sub(' ', text).strip()
+        return _truncate(text)
 
-    def get_all_news(self, category, days_back=2):
-        all_news = []
+    def _submit_feeds(self, executor, category, days_back=2):
         self.console.print(f"[bold blue]Fetching {category} news...[/bold blue]")
-        for feed_url in self.news_sources.get(category, []):
+        return {executor.submit(self.get_news_from_rss, feed_url, days_back): feed_url
+                for feed_url in self.news_sources.get(category, [])}
+
+    def _collect_news(self, category, futures):
+        feed_news = {}
+        for future in as_completed(futures):
             try:
-                news_items = self.get_news_from_rss(feed_url, days_back)
-                all_news.extend(news_items)
+                feed_news[futures[future]] = future.result()
             except Exception as e:
-                self.console.print(f"[red]Error processing {feed_url}: {e}[/red]")
-        all_news.sort(key=lambda x: x['date'], reverse=True)
+                self.console.print(f"[red]Error processing {futures[future]}: {e}[/red]")
+        # Merge in feed order so the copy kept by _dedupe doesn't depend on which feed answered first
+        all_news = []
+        for feed_url in self.news_sources.get(category, []):
+            all_news.extend(feed_news.get(feed_url, []))
+        all_news = _dedupe(all_news)
+        all_news.sort(key=lambda x: x['_ts'], reverse=True)
         return all_news
 
+    def get_all_news(self, category, days_back=2):
+        feed_count = len(self.news_sources.get(category, []))
+        with ThreadPoolExecutor(max_workers=max(1, min(10, feed_count))) as executor:
+            futures = self._submit_feeds(executor, category, days_back)
+            return self._collect_news(category, futures)
+
+    def _ncbi_get(self, url, **kwargs):
+        # Every E-utilities call goes through here so the tool/email/api_key params and
+        # NCBI's per-second limit apply no matter how many threads are searching
+        for attempt in range(3):
+            self._ncbi_rate_limiter.wait()
+            response = self.session.get(url, params=self.ncbi_params, timeout=self.request_timeout, **kwargs)
+            if response.status_code != 429 or attempt == 2:
+                return response
+            response.close()
+            time.sleep(0.3 * 2 ** attempt)
+
+    def _redact(self, message):
+        # Request errors quote the full URL, which carries the API key
+        message = str(message)
+        if self.ncbi_api_key:
+            message = message.replace(self.ncbi_api_key, '***')
+        return message
+
     def search_pubmed(self, query, days_back=7, max_results=8):
         papers = []
         try:
@@ -190,75 +411,114 @@ class DailyBiotechTrackerHTML:
             self.console.print(f"[bold green]Searching PubMed for: {query}...[/bold green]")
             encoded_query = urllib.parse.quote(final_query)
             search_url = f"{self.ncbi_base}esearch.fcgi?db=pubmed&term={encoded_query}&retmax={max_results}&retmode=xml"
-            response = requests.get(search_url)
-            response.raise_for_status()
-            root = ET.fromstring(response.content)
-            id_list = root.findall('.//Id')
+            # The query carries its date window, so a same-day rerun skips esearch entirely
+            id_list = self.cache.get_or_set(f"esearch:{search_url}", lambda: self._search_pubmed_ids(search_url))
             if id_list:
-                id_string = ','.join(id.text for id in id_list)
-                fetch_url = f"{self.ncbi_base}efetch.fcgi?db=pubmed&id={id_string}&retmode=xml"
-                response = requests.get(fetch_url)
-                response.raise_for_status()
-                for article in ET.fromstring(response.content).findall('.//PubmedArticle'):
-                    try:
-                        paper = self._parse_pubmed_article(article)
-                        if paper:
-                            paper['source'] = 'PubMed'
-                            papers.append(paper)
-                    except Exception as e:
-                        self.console.print(f"[red]Error processing PubMed article: {e}[/red]")
-                        continue
+                id_string = ','.join(sorted(id_list))
+                cached = self.cache.get_or_set(f"efetch:{id_string}", lambda: self._fetch_pubmed_articles(id_string))
+                # Hand out copies so scoring doesn't mutate the cached records
+                papers = [dict(paper) for paper in cached]
         except Exception as e:
-            self.console.print(f"[red]Error in PubMed search: {e}[/red]")
+            self.console.print(f"[red]Error in PubMed search: {self._redact(e)}[/red]")
         return papers
 
-    def search_biorxiv(self, keywords, days_back=7):
+    def _search_pubmed_ids(self, search_url):
+        id_list = []
+        with self._ncbi_get(search_url, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            for _, elem in ET.iterparse(response.raw, events=('end',), tag='Id'):
+                id_list.append(elem.text)
+                elem.clear()
+        return id_list
+
+    def _fetch_pubmed_articles(self, id_string):
         papers = []
-        try:
-            collections = ['microbiology', 'synthetic-biology', 'systems-biology', 'molecular-biology']
-            for collection in collections:
+        fetch_url = f"{self.ncbi_base}efetch.fcgi?db=pubmed&id={id_string}&retmode=xml"
+        with self._ncbi_get(fetch_url, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            # Parse one PubmedArticle at a time and drop it once read, instead of building the whole tree
+            for _, article in ET.iterparse(response.raw, events=('end',), tag='PubmedArticle'):
                 try:
-                    url = f"https://api.biorxiv.org/details/biorxiv/{collection}/0"
-                    response = requests.get(url)
-                    response.raise_for_status()
-                    data = response.json()
-                    for paper in data.get('collection', []):
-                        try:
-                            paper_date = datetime.strptime(paper['date'], '%Y-%m-%d')
-                            if (self.today - paper_date).days <= days_back:
-                                title = paper.get('title', '').lower()
-                                abstract = paper.get('abstract', '').lower() 
-                                if any(kw.lower() in title or kw.lower() in abstract for kw in keywords):
-                                    papers.append({
-                                        'title': paper['title'],
-                                        'authors': paper['authors'],
-                                        'abstract': paper.get('abstract', 'No abstract available'),
-                                        'date': paper['date'],
-                                        'source': 'bioRxiv',
-                                        'url': f"https://doi.org/{paper['doi']}"
-                                    })
-                        except Exception as e:
-                            continue
+                    paper = self._parse_pubmed_article(article)
+                    if paper:
+                        paper['source'] = 'PubMed'
+                        papers.append(paper)
+                except Exception as e:
+                    self.console.print(f"[red]Error processing PubMed article: {e}[/red]")
+                finally:
+                    # Also drop the emptied siblings the root still holds on to
+                    article.clear()
+                    while article.getprevious() is not None:
+                        del article.getparent()[0]
+        return papers
+
+    def _fetch_biorxiv_collection(self, collection):
+        url = f"https://api.biorxiv.org/details/biorxiv/{collection}/0"
+        def fetch():
+            response = self.session.get(url, timeout=self.request_timeout)
+            response.raise_for_status()
+            return response.json()
+        # Every paper category reads the same collections, so fetch each one once
+        return self.cache.get_or_set(f"biorxiv:{url}", fetch)
+
+    def _fetch_all_biorxiv(self, collections):
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(collections)) as executor:
+            futures = {executor.submit(self._fetch_biorxiv_collection, collection): collection
+                       for collection in collections}
+            for future in as_completed(futures):
+                collection = futures[future]
+                try:
+                    results[collection] = future.result()
                 except Exception as e:
                     self.console.print(f"[red]Error accessing bioRxiv {collection}: {e}[/red]")
-                    continue
+        # Keep the collection order stable regardless of completion order
+        return [results[collection] for collection in collections if collection in results]
+
+    def search_biorxiv(self, keywords, days_back=7):
+        papers = []
+        if not keywords:
+            return papers
+        try:
+            collections = ['microbiology', 'synthetic-biology', 'systems-biology', 'molecular-biology']
+            keyword_pattern = _any_keyword_pattern(tuple(keywords))
+            for data in self._fetch_all_biorxiv(collections):
+                for paper in data.get('collection', []):
+                    try:
+                        paper_date = _parse_iso_date(paper['date'])
+                        if (self.today - paper_date).days <= days_back:
+                            # Newline-joined so no keyword can match across the title/abstract boundary
+                            text = f"{paper.get('title', '')}\n{paper.get('abstract', '')}".lower()
+                            if keyword_pattern.search(text):
+                                papers.append({
+                                    'title': paper['title'],
+                                    'authors': paper['authors'],
+                                    'abstract': paper.get('abstract', 'No abstract available'),
+                                    'date': paper['date'],
+                                    'source': 'bioRxiv',
+                                    'url': f"https://doi.org/{paper['doi']}"
+                                })
+                    except Exception as e:
+                        continue
         except Exception as e:
             self.console.print(f"[red]Error in bioRxiv search: {e}[/red]")
         return papers
 
     def calculate_relevance_score(self, paper, category):
         score = 0
-        text_to_check = f"{paper['title']} {paper.get('abstract', '')}".lower()
-        category_keywords = self.keywords.get(category, {})
-        for keyword, weight in category_keywords.items():
-            if keyword.lower() in text_to_check:
+        title_lc = (paper.get('title') or '').lower()
+        text_lc = f"{title_lc} {(paper.get('abstract') or '').lower()}"
+        for keyword_lc, weight in self._keywords_lc.get(category, []):
+            if keyword_lc in text_lc:
                 score += weight
-                if keyword.lower() in paper['title'].lower():
+                if keyword_lc in title_lc:
                     score += 3
-        journal = paper.get('journal', '').strip()
+        journal = (paper.get('journal') or '').strip()
         score += self.journal_scores.get(journal, 0)
         try:
-            pub_date = datetime.strptime(paper['date'], '%Y-%m-%d')
+            pub_date = _parse_iso_date(paper['date'])
             days_old = (self.today - pub_date).days
             if days_old <= 1:
                 score += 5
@@ -269,21 +529,21 @@ class DailyBiotechTrackerHTML:
         return score
 
     def _parse_pubmed_article(self, article):
-        article_data = article.find('.//Article')
+        article_data = next(iter(self._XP_ARTICLE(article)), None)
         if article_data is None:
             return None
-        title_elem = article_data.find('.//ArticleTitle')
-        journal_elem = article_data.find('.//Journal/Title')
-        abstract_elems = article_data.findall('.//Abstract/AbstractText')
+        title_elem = next(iter(self._XP_TITLE(article_data)), None)
+        journal_elem = next(iter(self._XP_JOURNAL(article_data)), None)
+        abstract_elems = self._XP_ABSTRACT(article_data)
         authors = []
-        for author in article_data.findall('.//Author'):
+        for author in self._XP_AUTHORS(article_data):
             lastname = author.find('LastName')
             firstname = author.find('ForeName')
             if lastname is not None and firstname is not None:
                 authors.append(f"{lastname.text} {firstname.text}")
-        pub_date = article_data.find('.//PubDate')
+        pub_date = next(iter(self._XP_PUB_DATE(article_data)), None)
         date_str = self._parse_pub_date(pub_date)
-        id_list = article.findall('.//ArticleId')
+        id_list = self._XP_IDS(article)
         doi = None
         for id_elem in id_list:
             if id_elem.get('IdType') == 'doi':
@@ -296,7 +556,7 @@ class DailyBiotechTrackerHTML:
                 break
         abstract_text = ""
         for abstract_elem in abstract_elems:
-            text = abstract_elem.text or ""
+            text = ''.join(abstract_elem.itertext())
             label = abstract_elem.get('Label')
             if label:
                 abstract_text += f"{label}: {text} "
@@ -304,6 +564,9 @@ class DailyBiotechTrackerHTML:
                 abstract_text += f"{text} "
         if not abstract_text:
             abstract_text = "No abstract available"
+        # itertext keeps inline markup such as <i>Cutibacterium acnes</i>; .text stops at the first child
+        title = ''.join(title_elem.itertext()).strip() if title_elem is not None else ''
+        journal = ''.join(journal_elem.itertext()).strip() if journal_elem is not None else ''
         if doi:
             url = f"https://doi.org/{doi}"
         elif pmid:
@@ -311,9 +574,9 @@ class DailyBiotechTrackerHTML:
         else:
             url = None
         return {
-            'title': title_elem.text if title_elem is not None else "No title available",
+            'title': title or "No title available",
             'authors': ', '.join(authors[:3]) + (' et al.' if len(authors) > 3 else ''),
-            'journal': journal_elem.text if journal_elem is not None else "Journal not specified",
+            'journal': journal or "Journal not specified",
             'date': date_str,
             'abstract': abstract_text.strip(),
             'url': url
@@ -342,30 +605,85 @@ class DailyBiotechTrackerHTML:
             return f"{year_str}-{month_str}-{day_str}"
         return "Date not available"
 
-    def search_all_pubmed_categories(self, days_back=7):
+    def _search_category(self, category, days_back=7):
+        papers = self.search_pubmed(self._pubmed_queries[category], days_back=days_back)
+        bioRxiv_papers = self.search_biorxiv(self._biorxiv_kw_lists[category], days_back=days_back)
+        all_papers = _dedupe(papers + bioRxiv_papers)
+        for paper in all_papers:
+            paper['relevance_score'] = self.calculate_relevance_score(paper, category)
+            # Numeric tie-breaker for the relevance sort; undated papers sort last
+            try:
+                paper['_ts'] = _parse_iso_date(paper['date']).timestamp()
+            except (KeyError, TypeError, ValueError):
+                paper['_ts'] = 0.0
+        all_papers.sort(key=lambda x: (x['relevance_score'], x['_ts']), reverse=True)
+        return category, all_papers
+
+    def _submit_paper_searches(self, executor, days_back=7):
+        return [executor.submit(self._search_category, category, days_back)
+                for category in self.keywords]
+
+    def _collect_papers(self, futures):
+        found = {}
+        for future in as_completed(futures):
+            try:
+                category, papers = future.result()
+                found[category] = papers
+            except Exception as e:
+                self.console.print(f"[red]Error searching papers: {e}[/red]")
+        # Report sections follow the keyword order, not completion order
         results = {}
-        for category, keywords in self.keywords.items():
-            query_terms = []
-            for keyword in keywords.keys():
-                query_terms.append(f'"{keyword}"[All Fields]')
-            query = ' OR '.join(query_terms)
-            papers = self.search_pubmed(query, days_back=days_back)
-            bioRxiv_papers = self.search_biorxiv(list(keywords.keys()), days_back=days_back)
-            all_papers = papers + bioRxiv_papers
-            for paper in all_papers:
-                paper['relevance_score'] = self.calculate_relevance_score(paper, category)
-            all_papers.sort(key=lambda x: x['relevance_score'], reverse=True)
-            results[category] = all_papers
+        for category in self.keywords:
+            results[category] = found.get(category, [])
         return results
 
+    def search_all_pubmed_categories(self, days_back=7):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            return self._collect_papers(self._submit_paper_searches(executor, days_back))
+
+    def _render_news_item(self, item):
+        lines = [
+            "<div class='news-item'>",
+            f"<h3>{_escape(item.get('title'))}</h3>",
+            f"<p class='source-date'><em>{_escape(item.get('source'))} • {_escape(item.get('date'))}</em></p>",
+        ]
+        if item.get('summary'):
+            lines.append(f"<p>{_escape(item['summary'])}</p>")
+        lines.append(f"<p><a href='{_escape(item.get('link'))}' target='_blank'>Read more</a></p>")
+        lines.append("</div>")
+        return "\n".join(lines)
+
+    def _render_paper_item(self, paper):
+        # bioRxiv records have no journal; show the server name instead
+        journal = paper.get('journal') or paper.get('source')
+        abstract = _truncate(paper.get('abstract') or "No abstract available")
+        lines = [
+            "<div class='paper-item'>",
+            f"<h4>{_escape(paper.get('title'))}</h4>",
+            f"<p class='source-date'><em>{_escape(paper.get('authors'))} | {_escape(journal)} • {_escape(paper.get('date'))}</em></p>",
+            f"<p><strong>Abstract:</strong> {_escape(abstract)}</p>",
+        ]
+        if paper.get('url'):
+            lines.append(f"<p><a href='{_escape(paper['url'])}' target='_blank'>View Paper</a></p>")
+        lines.append("</div>")
+        return "\n".join(lines)
+
+    def _render_news_section(self, heading, items, empty_message):
+        if items:
+            body = "\n".join(self._render_news_item(item) for item in items)
+        else:
+            body = f"<p>{empty_message}</p>"
+        return f"<h2>{heading}</h2>\n{body}"
+
+    def _render_paper_section(self, category, papers):
+        if papers:
+            body = "\n".join(self._render_paper_item(paper) for paper in papers[:5])
+        else:
+            body = f"<p>No recent papers on {html.escape(category)} available today.</p>"
+        return f"<h3>{html.escape(category)} Papers</h3>\n{body}"
+
     def generate_html_report(self, news_data, paper_data):
-        html_lines = []
-        html_lines.append("<html>")
-        html_lines.append("<head>")
-        html_lines.append("<meta charset='utf-8'>")
-        html_lines.append("<title>Daily Biotech & Science Report ({})</title>".format(self.date_str))
-        html_lines.append("<style>")
-        html_lines.append("""
+        style = """
              body { font-family: Arial, sans-serif; margin: 20px; background-color: #f4f4f4; }
              .container { max-width: 800px; margin: auto; background: #fff; padding: 20px; }
              h1, h2, h3 { color: #333; }
@@ -373,83 +691,62 @@ class DailyBiotechTrackerHTML:
              .source-date { font-size: 0.9em; color: #666; }
              a { color: #1a0dab; text-decoration: none; }
              a:hover { text-decoration: underline; }
-         """)
-        html_lines.append("</style>")
-        html_lines.append("</head>")
-        html_lines.append("<body>")
-        html_lines.append("<div class='container'>")
-        html_lines.append("<h1>Daily Biotech & Science Report ({})</h1>".format(self.date_str))
-        # Biotech Industry News
-        html_lines.append("<h2>Biotech Industry & Market News</h2>")
-        biotech_news = news_data.get("Biotech Industry", [])
-        if biotech_news:
-            for item in biotech_news[:6]:
-                html_lines.append("<div class='news-item'>")
-                html_lines.append("<h3>{}</h3>".format(item['title']))
-                html_lines.append("<p class='source-date'><em>{} • {}</em></p>".format(item['source'], item['date']))
-                if item.get('summary'):
-                    html_lines.append("<p>{}</p>".format(item['summary']))
-                html_lines.append("<p><a href='{}' target='_blank'>Read more</a></p>".format(item['link']))
-                html_lines.append("</div>")
-        else:
-            html_lines.append("<p>No recent biotech industry news available today.</p>")
-        # Microbiome News
-        html_lines.append("<h2>Microbiome & Antimicrobials News</h2>")
-        microbiome_news = news_data.get("Microbiome News", [])
-        if microbiome_news:
-            for item in microbiome_news[:5]:
-                html_lines.append("<div class='news-item'>")
-                html_lines.append("<h3>{}</h3>".format(item['title']))
-                html_lines.append("<p class='source-date'><em>{} • {}</em></p>".format(item['source'], item['date']))
-                if item.get('summary'):
-                    html_lines.append("<p>{}</p>".format(item['summary']))
-                html_lines.append("<p><a href='{}' target='_blank'>Read more</a></p>".format(item['link']))
-                html_lines.append("</div>")
-        else:
-            html_lines.append("<p>No recent microbiome news available today.</p>")
-        # Divider for papers
-        html_lines.append("<hr>")
-        html_lines.append("<h2>Scientific Papers</h2>")
-        for category, papers in paper_data.items():
-            html_lines.append("<h3>{} Papers</h3>".format(category))
-            if papers:
-                for paper in papers[:5]:
-                    html_lines.append("<div class='paper-item'>")
-                    html_lines.append("<h4>{}</h4>".format(paper['title']))
-                    html_lines.append("<p class='source-date'><em>{} | {} • {}</em></p>".format(paper['authors'], paper['journal'], paper['date']))
-                    abstract = paper.get('abstract', "No abstract available")
-                    if len(abstract) > 300:
-                        abstract = abstract[:297] + "..."
-                    html_lines.append("<p><strong>Abstract:</strong> {}</p>".format(abstract))
-                    if paper.get('url'):
-                        html_lines.append("<p><a href='{}' target='_blank'>View Paper</a></p>".format(paper['url']))
-                    html_lines.append("</div>")
-            else:
-                html_lines.append("<p>No recent papers on {} available today.</p>".format(category))
-        html_lines.append("<hr>")
-        html_lines.append("<p><em>Report generated on {}</em></p>".format(self.date_str))
-        html_lines.append("</div>")
-        html_lines.append("</body>")
-        html_lines.append("</html>")
-        return "\n".join(html_lines)
+         """
+        sections = [
+            "<html>",
+            "<head>",
+            "<meta charset='utf-8'>",
+            f"<title>Daily Biotech & Science Report ({self.date_str})</title>",
+            "<style>",
+            style,
+            "</style>",
+            "</head>",
+            "<body>",
+            "<div class='container'>",
+            f"<h1>Daily Biotech & Science Report ({self.date_str})</h1>",
+            self._render_news_section("Biotech Industry & Market News",
+                                      news_data.get("Biotech Industry", [])[:6],
+                                      "No recent biotech industry news available today."),
+            self._render_news_section("Microbiome & Antimicrobials News",
+                                      news_data.get("Microbiome News", [])[:5],
+                                      "No recent microbiome news available today."),
+            # Divider for papers
+            "<hr>",
+            "<h2>Scientific Papers</h2>",
+        ]
+        sections.extend(self._render_paper_section(category, papers) for category, papers in paper_data.items())
+        sections.extend([
+            "<hr>",
+            f"<p><em>Report generated on {self.date_str}</em></p>",
+            "</div>",
+            "</body>",
+            "</html>",
+        ])
+        return "\n".join(sections)
 
     def generate_full_report(self):
         self.console.print("[bold]Generating your daily biotech and science report...[/bold]")
-        news_data = {}
-        for category in self.news_sources.keys():
-            news_data[category] = self.get_all_news(category, days_back=2)
-        paper_data = self.search_all_pubmed_categories(days_back=7)
+        # One pool for the whole run: every feed and every paper category is in flight at once,
+        # so the report waits for the slowest request rather than the slowest category in turn
+        feed_count = sum(len(feed_urls) for feed_urls in self.news_sources.values())
+        with ThreadPoolExecutor(max_workers=feed_count + len(self.keywords)) as executor:
+            # Paper searches chain several requests, so start them first
+            paper_futures = self._submit_paper_searches(executor, days_back=7)
+            news_futures = {category: self._submit_feeds(executor, category, days_back=2)
+                            for category in self.news_sources}
+            news_data = {category: self._collect_news(category, futures)
+                         for category, futures in news_futures.items()}
+            paper_data = self._collect_papers(paper_futures)
         html_report = self.generate_html_report(news_data, paper_data)
         
         # Save with today's date for archival purposes (optional)
         date_report_path = self.output_dir / f"daily_biotech_report_{self.date_str}.html"
-        with open(date_report_path, 'w', encoding='utf-8') as f:
-            f.write(html_report)
+        date_report_path.write_text(html_report, encoding='utf-8')
         
-        # Save as index.html (this will be the main file for GitHub Pages)
+        # Save as index.html (this will be the main file for GitHub Pages); copy the file
+        # we just wrote rather than encoding the report a second time
         index_path = self.output_dir / "index.html"
-        with open(index_path, 'w', encoding='utf-8') as f:
-            f.write(html_report)
+        shutil.copyfile(date_report_path, index_path)
         
         self.console.print(f"\n[bold green]Reports saved to:[/bold green] {date_report_path} and {index_path}")
         return index_path